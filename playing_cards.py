@@ -10,7 +10,9 @@ A module for playing cards.
 __all__ = ['PlayingCard', 'Deck', 'Hand', 'makeDeckInNewDeckOrder',
            'makeEuchreDeck', 'makePinochleDeck']
 
-from typing import Iterable, List
+from functools import lru_cache
+from operator import itemgetter
+from typing import Callable, Iterable, Iterator, List, Sequence, Tuple
 from random import shuffle as _shuffle
 
 VALUES = ['Joker', 'Ace', 'Two', 'Three', 'Four', 'Five', 'Six',
@@ -18,6 +20,84 @@ VALUES = ['Joker', 'Ace', 'Two', 'Three', 'Four', 'Five', 'Six',
 
 SUITS = ['Clubs', 'Hearts', 'Spades', 'Diamonds']
 
+_VALUE_BY_NAME = {name.lower(): i for i, name in enumerate(VALUES)}
+_SUIT_BY_NAME = {name.lower(): i for i, name in enumerate(SUITS)}
+
+
+@lru_cache(maxsize=128)
+def _faro_perm(n: int, top: int, bottom: int, kind: str) -> Tuple[int, ...]:
+    """
+    Return the source index of each position after a faro of n cards,
+    so that new_deck[i] == old_deck[perm[i]].
+
+    top and bottom are the number of cards in each half, taken with the
+    same slicing as deck[:top] and deck[-bottom:]. kind is 'out' to
+    start the weave from the top half or 'in' to start from the bottom
+    half.
+    """
+    indices = range(n)
+    if kind == 'out':
+        return tuple(_interleave(indices[:top], indices[-bottom:]))
+
+    return tuple(_interleave(indices[-bottom:], indices[:top]))
+
+
+@lru_cache(maxsize=128)
+def _faro_gather(n: int, top: int, bottom: int,
+                 kind: str) -> Callable[[List], Tuple]:
+    """
+    Return a callable that takes a list of n cards and returns them as
+    a tuple in faro order. See _faro_perm() for the parameters.
+
+    For two or more cards an itemgetter does the whole gather in C.
+    """
+    perm = _faro_perm(n, top, bottom, kind)
+    if len(perm) > 1:
+        return itemgetter(*perm)
+
+    return lambda cards: tuple([cards[i] for i in perm])
+
+
+@lru_cache(maxsize=128)
+def _out_faro_gather(n: int) -> Callable[[List], Tuple]:
+    """
+    Return the gather for a perfect out-faro of n cards, with the
+    larger half on top. Decks of fewer than two cards are unchanged by
+    a faro, so for those the callable is tuple.
+    """
+    if n < 2:
+        return tuple
+
+    return _faro_gather(n, (n + 1) // 2, n // 2, 'out')
+
+
+@lru_cache(maxsize=128)
+def _in_faro_gather(n: int) -> Callable[[List], Tuple]:
+    """
+    Return the gather for a perfect in-faro of n cards, with the
+    larger half on the bottom. Decks of fewer than two cards are
+    unchanged by a faro, so for those the callable is tuple.
+    """
+    if n < 2:
+        return tuple
+
+    return _faro_gather(n, n // 2, (n + 1) // 2, 'in')
+
+
+def _interleave(first: Sequence, second: Sequence) -> list:
+    """
+    Weave two sequences into a list one item at a time, starting with
+    the first sequence. Whatever is left of the longer sequence goes on
+    the end.
+    """
+    m = min(len(first), len(second))
+    woven = [None] * (len(first) + len(second))
+    woven[0:2*m:2] = first[:m]
+    woven[1:2*m:2] = second[:m]
+    woven[2*m:] = first[m:] if len(first) > len(second) else second[m:]
+
+    return woven
+
 
 def main():
     deck = makeDeckInNewDeckOrder()
@@ -38,34 +118,87 @@ class PlayingCard():
     suit can be either a string ('Clubs', 'Diamonds') or an integer
     following the CHaSeD order (0 = Clubs, 1 = Hearts, 2 = Spades,
     3 = Diamonds).
+
+    PlayingCards are immutable: decks share one instance of each card,
+    so value, suit, value_name, suit_name and name are read-only.
     """
+    __slots__ = ('_value', '_suit', '_value_name', '_suit_name', '_name',
+                 '_hash')
+
     def __init__(self, value: int or str, suit: int or str):
         if isinstance(value, int):
             if value > 13:
                 raise ValueError("value must be between 0 and 13 (inclusive).")
-            self.value = value
-            self.value_name = VALUES[value]
+            self._value = value
+            self._value_name = VALUES[value]
         elif isinstance(value, str):
-            if value.title() not in VALUES:
-                raise ValueError(f"{value.title()} is not a valid playing card value.")
-            self.value_name = value.title()
-            self.value = VALUES.index(value.title())
+            try:
+                self._value = _VALUE_BY_NAME[value.lower()]
+            except KeyError:
+                raise ValueError(
+                    f"{value.title()} is not a valid playing card value."
+                ) from None
+            self._value_name = VALUES[self._value]
 
         if isinstance(suit, int):
             if suit > 3:
                 raise ValueError("suit must be between 0 and 3 (inclusive).")
-            self.suit = suit
-            self.suit_name = SUITS[suit]
+            self._suit = suit
+            self._suit_name = SUITS[suit]
         elif isinstance(suit, str):
-            if suit.title() not in SUITS:
-                raise ValueError("f{suit} is not a valid playing card suit.")
-            self.suit_name = suit.title()
-            self.suit = SUITS.index(suit.title())
-
-        if self.value == 0:
-            self.name = "Joker"
+            try:
+                self._suit = _SUIT_BY_NAME[suit.lower()]
+            except KeyError:
+                raise ValueError(
+                    f"{suit.title()} is not a valid playing card suit."
+                ) from None
+            self._suit_name = SUITS[self._suit]
+
+        if self._value == 0:
+            self._name = "Joker"
         else:
-            self.name = " ".join((self.value_name, "of", self.suit_name))
+            self._name = " ".join((self._value_name, "of", self._suit_name))
+
+        self._hash = hash((self._value, self._suit))
+
+    @property
+    def value(self) -> int:
+        """The card's value."""
+        return self._value
+
+    @property
+    def suit(self) -> int:
+        """The card's suit."""
+        return self._suit
+
+    @property
+    def value_name(self) -> str:
+        """The name of the card's value."""
+        return self._value_name
+
+    @property
+    def suit_name(self) -> str:
+        """The name of the card's suit."""
+        return self._suit_name
+
+    @property
+    def name(self) -> str:
+        """The card's human-readable name (e.g. 'Ace of Spades')."""
+        return self._name
+
+    @classmethod
+    def get(cls, value: int, suit: int) -> 'PlayingCard':
+        """
+        Return the shared PlayingCard for the given integer value and
+        suit.
+
+        Every card a deck factory builds comes from one table made at
+        import time, so no new PlayingCard objects are created.
+        """
+        if 0 <= value < len(VALUES) and 0 <= suit < len(SUITS):
+            return _CARD_TABLE[(suit << 4) | value]
+
+        raise ValueError(f"({value}, {suit}) is not a valid playing card.")
 
     def __eq__(self, other) -> bool:
         """
@@ -75,18 +208,18 @@ class PlayingCard():
         suit are identical.
         """
         if isinstance(other, PlayingCard):
-            if (self.value, self.suit) == (other.value, other.suit):
+            if (self._value, self._suit) == (other._value, other._suit):
                 return True
 
         return False
 
     def __hash__(self) -> int:
         """Return hash(self)."""
-        return hash((self.value, self.suit, self.name))
+        return self._hash
 
     def __repr__(self) -> str:
         return (f'{self.__class__.__name__}('
-                f"'{self.value_name}', '{self.suit_name})'")
+                f"'{self._value_name}', '{self._suit_name})'")
 
     def __str__(self) -> str:
         """
@@ -95,30 +228,39 @@ class PlayingCard():
         Return a human-readable string of the card's name
         (e.g. 'Ace of Spades').
         """
-        return self.name
+        return self._name
 
     def get_name(self) -> str:
         """
         Return a human-readable string of the card's name
         (e.g. 'Ace of Spades').
         """
-        return self.name
+        return self._name
 
     def get_value(self) -> int:
         """Return the card's value."""
-        return self.value
+        return self._value
 
     def get_suit(self) -> int:
         """Return the card's suit."""
-        return self.suit
+        return self._suit
 
     def get_value_name(self) -> str:
         """Return the name of the card's value."""
-        return self.value_name
+        return self._value_name
 
     def get_suit_name(self) -> str:
         """Return the name of the card's suit."""
-        return self.suit_name
+        return self._suit_name
+
+
+# One shared instance for every (value, suit) combination, indexed by
+# (suit << 4) | value. Unused slots hold None.
+_CARD_TABLE = [None] * 64
+for _suit in range(len(SUITS)):
+    for _value in range(len(VALUES)):
+        _CARD_TABLE[(_suit << 4) | _value] = PlayingCard(_value, _suit)
+del _suit, _value
 
 
 class Deck():
@@ -137,15 +279,33 @@ class Deck():
         Return self == other.
 
         Two decks are considered equivalent if they have the exact same
-        cards in the exact same order.
+        cards in the exact same order. Cards are compared by value and
+        suit, so Jokers of different suits are not equal.
         """
         if isinstance(other, Deck):
             if len(self) == len(other):
-                if self.get_list_of_cards() == other.get_list_of_cards():
+                if self.cards == other.cards:
                     return True
 
         return False
 
+    def __getitem__(self, index: int or slice) -> PlayingCard:
+        """
+        Return self[index].
+
+        The top card of the deck is at position 0. Slicing returns a
+        list of PlayingCards.
+        """
+        return self.cards[index]
+
+    def __iter__(self) -> Iterator[PlayingCard]:
+        """
+        Return iter(self).
+
+        Iterate over the cards from the top of the deck to the bottom.
+        """
+        return iter(self.cards)
+
     def __len__(self) -> int:
         """
         Return len(self).
@@ -215,7 +375,11 @@ class Deck():
         if cards_off_top == -1:
             cards_off_top = len(self) // 2
 
-        self.cards = self.cards[cards_off_top:] + self.cards[:cards_off_top]
+        cards = self.cards
+        if -len(cards) < cards_off_top < len(cards):
+            cards_off_top %= len(cards)
+            cards.extend(cards[:cards_off_top])
+            del cards[:cards_off_top]
 
     def add_card(self, card: PlayingCard) -> None:
         """Add a PlayingCard to the Deck."""
@@ -276,39 +440,21 @@ class Deck():
         with the number of cards you want to cut from the top or bottom
         of the deck, respectively.
         """
+        cards = self.cards
+        n = len(cards)
         if (number_of_cards_on_bottom, number_of_cards_on_top) == (0, 0):
-            newDeck = [None for i in range(len(self))]
-            for i, card in enumerate(self.cards):
-                newPosition = i*2
-                if newPosition >= len(self):
-                    newPosition += 1
-                    newPosition %= len(self)
-                newDeck[newPosition] = card
+            gather = _out_faro_gather(n)
+        elif number_of_cards_on_bottom == 0:
+            gather = _faro_gather(n, number_of_cards_on_top,
+                                  n - number_of_cards_on_top, 'out')
+        elif number_of_cards_on_top == 0:
+            gather = _faro_gather(n, n - number_of_cards_on_bottom,
+                                  number_of_cards_on_bottom, 'out')
         else:
-            if number_of_cards_on_bottom == 0:
-                number_of_cards_on_bottom = (
-                    len(self) - number_of_cards_on_top)
-            elif number_of_cards_on_top == 0:
-                number_of_cards_on_top = (
-                    len(self) - number_of_cards_on_bottom)
-
-            topHalf = self.cards[:number_of_cards_on_top]
-            bottomHalf = self.cards[-number_of_cards_on_bottom:]
-            numberOfIterations = (
-                len(topHalf) if len(topHalf) > len(bottomHalf)
-                else len(bottomHalf))
-            newDeck = []
-            for i in range(numberOfIterations):
-                try:
-                    newDeck.append(topHalf[i])
-                except:
-                    pass
-                try:
-                    newDeck.append(bottomHalf[i])
-                except:
-                    pass
-
-        self.cards = newDeck
+            gather = _faro_gather(n, number_of_cards_on_top,
+                                  number_of_cards_on_bottom, 'out')
+
+        self.cards = list(gather(cards))
 
     def in_faro(self, number_of_cards_on_top: int = 0,
                 number_of_cards_on_bottom: int = 0) -> None:
@@ -322,39 +468,21 @@ class Deck():
         See the Deck.out_faro() documentation for parameter
         information.
         """
+        cards = self.cards
+        n = len(cards)
         if (number_of_cards_on_bottom, number_of_cards_on_top) == (0, 0):
-            newDeck = [None for i in range(len(self))]
-            for i, card in enumerate(self.cards):
-                newPosition = i*2 + 1
-                if newPosition >= len(self):
-                    newPosition -= 1
-                    newPosition %= len(self)
-                newDeck[newPosition] = card
+            gather = _in_faro_gather(n)
+        elif number_of_cards_on_bottom == 0:
+            gather = _faro_gather(n, number_of_cards_on_top,
+                                  n - number_of_cards_on_top, 'in')
+        elif number_of_cards_on_top == 0:
+            gather = _faro_gather(n, n - number_of_cards_on_bottom,
+                                  number_of_cards_on_bottom, 'in')
         else:
-            if number_of_cards_on_bottom == 0:
-                number_of_cards_on_bottom = (
-                    len(self) - number_of_cards_on_top)
-            elif number_of_cards_on_top == 0:
-                number_of_cards_on_top = (
-                    len(self) - number_of_cards_on_bottom)
-
-            topHalf = self.cards[:number_of_cards_on_top]
-            bottomHalf = self.cards[-number_of_cards_on_bottom:]
-            numberOfIterations = (
-                len(topHalf) if len(topHalf) > len(bottomHalf)
-                else len(bottomHalf))
-            newDeck = []
-            for i in range(numberOfIterations):
-                try:
-                    newDeck.append(bottomHalf[i])
-                except:
-                    pass
-                try:
-                    newDeck.append(topHalf[i])
-                except:
-                    pass
-
-        self.cards = newDeck
+            gather = _faro_gather(n, number_of_cards_on_top,
+                                  number_of_cards_on_bottom, 'in')
+
+        self.cards = list(gather(cards))
 
     def print_cards(self) -> None:
         for i, card in enumerate(self.cards):
@@ -365,7 +493,7 @@ class Deck():
 class Hand(Deck):
     """A player's hand of PlayingCards."""
     def __init__(self, label='') -> None:
-        self.cards = []
+        super().__init__(())
         self.label = label
 
     def __str__(self) -> str:
@@ -375,6 +503,29 @@ class Hand(Deck):
             return f"Hand of {len(self)} cards."
 
 
+def _new_deck_order(suit_order: Tuple[str, ...]) -> Tuple[PlayingCard, ...]:
+    """
+    Return the cards of a deck in New Deck Order for the given suit
+    order. The first two suits run Ace to King, the last two King to
+    Ace.
+    """
+    deck = []
+    for suit in suit_order[:2]:
+        for value in range(1, 14):
+            deck.append(PlayingCard.get(value, SUITS.index(suit)))
+    for suit in suit_order[2:]:
+        for value in reversed(range(1, 14)):
+            deck.append(PlayingCard.get(value, SUITS.index(suit)))
+
+    return tuple(deck)
+
+
+_NDO_CARDS = dict(
+    US = _new_deck_order(("Hearts", "Clubs", "Diamonds", "Spades")),
+    European = _new_deck_order(("Spades", "Hearts", "Diamonds", "Clubs")),
+)
+
+
 def makeDeckInNewDeckOrder(mode: str="US") -> Deck:
     """
     Create and return a Deck object in New Deck Order (NDO).
@@ -383,22 +534,18 @@ def makeDeckInNewDeckOrder(mode: str="US") -> Deck:
     Company. By setting mode to 'European', return a deck in NDO used
     by European playing card companies like, e.g., Cartamundi.
     """
-    suitOrder = dict(
-        US = ("Hearts", "Clubs", "Diamonds", "Spades"),
-        European = ("Spades", "Hearts", "Diamonds", "Clubs"),
-    )
-    if mode not in suitOrder.keys():
+    if mode not in _NDO_CARDS.keys():
         raise ValueError("mode must be 'US' or 'European'.")
 
-    deck = []
-    for suit in suitOrder[mode][:2]:
-        for value in range(1, 14):
-            deck.append(PlayingCard(value, suit))
-    for suit in suitOrder[mode][2:]:
-        for value in reversed(range(1, 14)):
-            deck.append(PlayingCard(value, suit))
+    return Deck(_NDO_CARDS[mode])
+
 
-    return Deck(deck)
+# Nine through King, then Ace, in each suit.
+_EUCHRE_CARDS = tuple(PlayingCard.get(value, suit)
+                      for suit in range(len(SUITS))
+                      for value in (9, 10, 11, 12, 13, 1))
+
+_PINOCHLE_CARDS = tuple(card for card in _EUCHRE_CARDS for _ in range(2))
 
 
 def makeEuchreDeck() -> Deck:
@@ -407,13 +554,7 @@ def makeEuchreDeck() -> Deck:
 
     Euchre uses cards from all suits valued from nine (9) to Ace high.
     """
-    cards = []
-    for suit in SUITS:
-        for value in range(9, 14):
-            cards.append(PlayingCard(value, suit))
-        cards.append(PlayingCard(1, suit))
-
-    return Deck(cards)
+    return Deck(_EUCHRE_CARDS)
 
 
 def makePinochleDeck() -> Deck:
@@ -423,15 +564,7 @@ def makePinochleDeck() -> Deck:
     Pinochle uses a deck of cards made of two copies of each card from
     nine (9) to Ace high.
     """
-    cards = []
-    for suit in SUITS:
-        for value in range(9, 14):
-            for _ in range(2):
-                cards.append(PlayingCard(value, suit))
-        for _ in range(2):
-            cards.append(PlayingCard(1, suit))
-
-    return Deck(cards)
+    return Deck(_PINOCHLE_CARDS)
 
 
 if __name__ == "__main__":